@@ -4,26 +4,32 @@ Provides Manager and Executive dashboards with NLP chat interface.
 """
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import json
+import threading
+import time
+import orjson
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 import pandas as pd
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
+CACHE_TTL = 30  # seconds to reuse GET responses across reruns
+CHAT_HISTORY_LIMIT = 50
+HEALTH_CHECK_INTERVAL = 15  # seconds between background health probes
+NLP_POLL_INTERVAL = 0.5  # seconds between progress refreshes of a running message
+# Keys of a parsed message that are not extracted entities
+PARSED_META_KEYS = frozenset({"intent", "action", "confidence", "original_message", "timestamp"})
 PAGE_ICON = "📊"
 LAYOUT = "wide"
 
-# Page config
-st.set_page_config(
-    page_title="FASTMCP – Sales ERP",
-    page_icon=PAGE_ICON,
-    layout=LAYOUT,
-    initial_sidebar_state="expanded",
-)
-
-# Custom CSS
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     .main {
         padding: 2rem;
@@ -49,7 +55,67 @@ st.markdown("""
         margin: 1rem 0;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+NLP_EXAMPLES_TEXT = """
+    Send natural language messages to automate sales operations.
+    Examples:
+    - "Google ka iss week ka 1.2 lakh payment aa gaya"
+    - "Ramesh is assigned to Google project"
+    - "Google project active karo"
+    - "Dharmendra ke sare active project dikhado"
+    """
+
+ABOUT_MARKDOWN = """
+        ## FASTMCP – Sales Team Automation ERP
+        
+        FASTMCP is a comprehensive **MCP Server** built with **FastAPI**, **PostgreSQL**, 
+        and **SQLAlchemy ORM** for automating sales team workflows.
+        
+        ### Key Features
+        
+        - **Sales Project Management** – Track multiple projects per client
+        - **Team Management** – Assign employees to projects with duration tracking
+        - **Payment Tracking** – Record and track weekly/pending payments
+        - **NLP Automation** – Convert natural language messages into database actions
+        - **Role-Based Dashboards** – Separate views for Managers and Executives
+        
+        ### Technology Stack
+        
+        - **Backend**: FastAPI + fastmcp
+        - **Database**: PostgreSQL + SQLAlchemy ORM
+        - **Frontend**: Streamlit (this app) + React
+        - **Language**: Python 3.11+
+        
+        ### Example NLP Commands
+        
+        - "Google ka iss week ka 1.2 lakh payment aa gaya"
+        - "Ramesh is assigned to Google project"
+        - "Google project active karo"
+        - "Dharmendra ke sare active project dikhado"
+        
+        ### Getting Started
+        
+        1. Ensure the FastAPI server is running on `http://localhost:8000`
+        2. Select a user from the sidebar
+        3. Navigate to Dashboard or NLP Chat
+        4. Explore the features!
+        
+        ### Documentation
+        
+        For more information, see `FASTMCP_README.md` in the project root.
+        """
+
+# Page config
+st.set_page_config(
+    page_title="FASTMCP – Sales ERP",
+    page_icon=PAGE_ICON,
+    layout=LAYOUT,
+    initial_sidebar_state="expanded",
+)
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 
 # ============================================================================
@@ -63,43 +129,126 @@ def initialize_session():
     if "user_role" not in st.session_state:
         st.session_state.user_role = "manager"
     if "chat_messages" not in st.session_state:
-        st.session_state.chat_messages = []
+        st.session_state.chat_messages = deque(maxlen=CHAT_HISTORY_LIMIT)
+    if "health" not in st.session_state:
+        st.session_state.health = {"result": None, "checked_at": None, "probing": False}
 
 
 # ============================================================================
 # API Helper Functions
 # ============================================================================
 
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Return a shared HTTP session that keeps connections alive across reruns."""
+    session = requests.Session()
+    # Retry connection errors and transient statuses with exponential backoff.
+    # Read timeouts are not retried, and neither are POSTs.
+    retries = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def api_call(endpoint: str, method: str = "GET", data: Optional[Dict] = None) -> Dict[str, Any]:
     """Make an API call to the FastAPI backend."""
     url = f"{API_BASE_URL}{endpoint}"
+    session = get_http_session()
     
     try:
         if method == "GET":
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
         elif method == "POST":
-            response = requests.post(url, json=data, timeout=10)
+            response = session.post(url, json=data, timeout=10)
         else:
             return {"success": False, "error": f"Unknown method: {method}"}
         
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.ConnectionError:
+        return orjson.loads(response.content)
+    except Exception as e:
+        return api_error(e)
+
+
+def api_error(error: Exception) -> Dict[str, Any]:
+    """Convert an exception raised while calling the API into an error result."""
+    if isinstance(error, requests.exceptions.ConnectionError):
         return {"success": False, "error": "Cannot connect to API server. Is it running on port 8000?"}
-    except requests.exceptions.Timeout:
+    if isinstance(error, requests.exceptions.Timeout):
         return {"success": False, "error": "API request timed out"}
+    return {"success": False, "error": str(error)}
+
+
+@st.cache_resource
+def get_etag_store() -> Dict[str, Dict[str, Any]]:
+    """Return the shared ``{endpoint: {"etag", "data"}}`` store of GET responses."""
+    return {}
+
+
+def api_get(endpoint: str) -> Dict[str, Any]:
+    """GET an endpoint, raising on any failure instead of returning an error result.
+
+    The last successful response is revalidated with ``If-None-Match``; on
+    ``304 Not Modified`` the stored data is reused without downloading or
+    decoding the payload again.
+    """
+    etag_store = get_etag_store()
+    stored = etag_store.get(endpoint)
+    headers = {"If-None-Match": stored["etag"]} if stored else None
+    
+    response = get_http_session().get(f"{API_BASE_URL}{endpoint}", headers=headers, timeout=10)
+    if response.status_code == 304 and stored:
+        return stored["data"]
+    response.raise_for_status()
+    result = orjson.loads(response.content)
+    if result.get("success") is False:
+        raise RuntimeError(result.get("error", "Unknown error"))
+    
+    etag = response.headers.get("ETag")
+    if etag:
+        etag_store[endpoint] = {"etag": etag, "data": result}
+    return result
+
+
+def cached_call(fetcher: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+    """Call a cached fetcher, turning a failure into an error result.
+
+    Cached fetchers raise on failure, so st.cache_data never stores an error
+    and the next rerun retries instead of serving it to every session.
+    """
+    try:
+        return fetcher(*args)
     except Exception as e:
-        return {"success": False, "error": str(e)}
+        return api_error(e)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_manager_dashboard(manager_id: int) -> Dict[str, Any]:
+    """Fetch manager dashboard data, raising on failure."""
+    return api_get(f"/api/manager/dashboard/{manager_id}")
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_executive_dashboard(executive_id: int) -> Dict[str, Any]:
+    """Fetch executive dashboard data, raising on failure."""
+    return api_get(f"/api/executive/dashboard/{executive_id}")
 
 
 def get_manager_dashboard(manager_id: int) -> Dict[str, Any]:
     """Fetch manager dashboard data."""
-    return api_call(f"/api/manager/dashboard/{manager_id}")
+    return cached_call(fetch_manager_dashboard, manager_id)
 
 
 def get_executive_dashboard(executive_id: int) -> Dict[str, Any]:
     """Fetch executive dashboard data."""
-    return api_call(f"/api/executive/dashboard/{executive_id}")
+    return cached_call(fetch_executive_dashboard, executive_id)
 
 
 def process_nlp_message(message: str, user_id: int) -> Dict[str, Any]:
@@ -110,9 +259,186 @@ def process_nlp_message(message: str, user_id: int) -> Dict[str, Any]:
     })
 
 
+@st.cache_resource
+def get_stream_support() -> Dict[str, bool]:
+    """Return the shared record of whether the server has the streaming endpoint."""
+    return {"available": True}
+
+
+def is_missing_route(response: requests.Response) -> bool:
+    """Tell whether a response is FastAPI's 404 for an unknown route."""
+    if response.status_code != 404:
+        return False
+    try:
+        return orjson.loads(response.content) == {"detail": "Not Found"}
+    except orjson.JSONDecodeError:
+        return False
+
+
+def stream_nlp_message(message: str, user_id: int) -> Iterator[Dict[str, Any]]:
+    """Send a message to the streaming NLP processor and yield each phase.
+
+    The server answers with server-sent events whose data are JSON fragments
+    of the regular ``/api/mcp/message`` response: ``success`` and ``parsed``
+    first, then ``execution``. Uses the blocking endpoint instead once the
+    server has shown it has no streaming endpoint.
+    """
+    stream_support = get_stream_support()
+    if not stream_support["available"]:
+        yield process_nlp_message(message, user_id)
+        return
+    
+    url = f"{API_BASE_URL}/api/mcp/message/stream"
+    payload = {"message": message, "user_id": user_id}
+    
+    try:
+        with get_http_session().post(url, json=payload, stream=True, timeout=10) as response:
+            if is_missing_route(response):
+                stream_support["available"] = False
+                yield process_nlp_message(message, user_id)
+                return
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.startswith(b"data:"):
+                    yield orjson.loads(line[5:])
+    except Exception as e:
+        yield api_error(e)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_users() -> Dict[str, Any]:
+    """Fetch all users, raising on failure.
+
+    Also builds ``users_by_id`` and the selectbox ``user_options`` once per
+    cached payload.
+    """
+    result = api_get("/api/users")
+    users = result.get("users", [])
+    return {
+        **result,
+        "users_by_id": {u["id"]: u for u in users},
+        "user_options": {u["id"]: f"{u['name']} ({u['role']})" for u in users},
+    }
+
+
 def get_users() -> Dict[str, Any]:
     """Fetch all users."""
-    return api_call("/api/users")
+    return cached_call(fetch_users)
+
+
+def get_health() -> Dict[str, Any]:
+    """Fetch the API server health status."""
+    return api_call("/health")
+
+
+def with_script_run_ctx(func: Callable) -> Callable:
+    """Wrap ``func`` so it runs with the current script context in a worker thread.
+
+    Cached fetchers and the shared HTTP session need the context to work.
+    """
+    ctx = get_script_run_ctx()
+
+    def run(*args, **kwargs):
+        add_script_run_ctx(ctx=ctx)
+        return func(*args, **kwargs)
+
+    return run
+
+
+def fetch_concurrently(*fetchers: Callable[[], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run several API fetchers in parallel and return their results in order."""
+    if len(fetchers) == 1:
+        return [fetchers[0]()]
+    run = with_script_run_ctx(lambda fetcher: fetcher())
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        return list(executor.map(run, fetchers))
+
+
+def get_dashboard(user_id: int, role: str) -> Dict[str, Any]:
+    """Fetch the dashboard matching a user's role."""
+    if role == "manager":
+        return get_manager_dashboard(user_id)
+    return get_executive_dashboard(user_id)
+
+
+def fetch_page_data() -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Fetch users and (on the Dashboard page) the current user's dashboard at once.
+
+    Returns the users result and the dashboard result, or ``None`` for the
+    dashboard on other pages.
+    """
+    fetchers = [get_users]
+    if st.session_state.get("page", "Dashboard") == "Dashboard":
+        user_id, role = st.session_state.user_id, st.session_state.user_role
+        fetchers.append(lambda: get_dashboard(user_id, role))
+    results = fetch_concurrently(*fetchers)
+    return results[0], (results[1] if len(results) > 1 else None)
+
+
+def refresh_health() -> Optional[Dict[str, Any]]:
+    """Return the last known health result, re-probing it in the background.
+
+    A probe starts at most every ``HEALTH_CHECK_INTERVAL`` seconds, and never
+    while the previous one is still running. Its result shows up on a later
+    rerun, so the sidebar never waits on it. Returns ``None`` until the first
+    probe has finished.
+    """
+    health = st.session_state.health
+    if health["probing"]:
+        return health["result"]
+    
+    now = time.monotonic()
+    if health["checked_at"] is None or now - health["checked_at"] > HEALTH_CHECK_INTERVAL:
+        health["checked_at"] = now
+        health["probing"] = True
+        
+        def probe():
+            try:
+                health["result"] = get_health()
+            finally:
+                health["probing"] = False
+        
+        threading.Thread(target=with_script_run_ctx(probe), daemon=True).start()
+    return health["result"]
+
+
+@st.cache_resource
+def get_nlp_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool that processes NLP messages."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="nlp")
+
+
+def start_nlp_job(message: str, user_id: int) -> Dict[str, Any]:
+    """Process a message in the background and return its job record.
+
+    The worker appends each streamed phase to ``chunks`` and sets ``done``
+    when finished.
+    """
+    job = {
+        "message": message,
+        "chunks": [],
+        "done": threading.Event(),
+    }
+    get_nlp_executor().submit(with_script_run_ctx(run_nlp_job), job, user_id)
+    return job
+
+
+def run_nlp_job(job: Dict[str, Any], user_id: int):
+    """Consume the NLP stream for ``job`` until it ends.
+
+    A successful message may change payments, statuses or assignments, so
+    the cached dashboards are dropped before the job is marked done.
+    """
+    result = {}
+    try:
+        for chunk in stream_nlp_message(job["message"], user_id):
+            result.update(chunk)
+            job["chunks"].append(chunk)
+        if result.get("success"):
+            fetch_manager_dashboard.clear()
+            fetch_executive_dashboard.clear()
+    finally:
+        job["done"].set()
 
 
 # ============================================================================
@@ -158,34 +484,52 @@ def display_projects_table(projects: list):
         st.info("No projects found")
         return
     
-    # Convert to DataFrame for better display
-    df = pd.DataFrame([
-        {
-            "Project": p.get("name", "N/A"),
-            "Client": p.get("client", "N/A"),
-            "Status": p.get("status", "N/A").upper(),
-            "Value": f"₹{p.get('estimated_value', 0):,.0f}" if p.get('estimated_value') else "N/A",
-        }
-        for p in projects
-    ])
+    # Convert to DataFrame with whole-column operations. Client and Status
+    # repeat a few values, so categoricals keep them dictionary-encoded in Arrow.
+    raw = pd.DataFrame(projects).reindex(
+        columns=["name", "client", "status", "estimated_value"]
+    )
+    values = pd.to_numeric(raw["estimated_value"], errors="coerce")
+    df = pd.DataFrame({
+        "Project": raw["name"].fillna("N/A"),
+        "Client": raw["client"].fillna("N/A").astype("category"),
+        "Status": raw["status"].fillna("N/A").str.upper().astype("category"),
+        "Value": values.where(values != 0),
+    })
     
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    # Values stay numeric; the frontend formats them as currency
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Value": st.column_config.NumberColumn("Value", format="₹%.0f"),
+        },
+    )
 
 
-def display_manager_dashboard():
+def display_refresh_button(fetcher):
+    """Display a button that drops the cached data of ``fetcher``.
+
+    Clearing happens in the click callback, before the rerun fetches data.
+    """
+    st.button("🔄 Refresh", key=f"refresh_{fetcher.__name__}", on_click=fetcher.clear)
+
+
+def display_manager_dashboard(result: Dict[str, Any]):
     """Display the Manager Dashboard."""
     st.title("👔 Manager Dashboard")
-    
-    # Fetch data
-    result = get_manager_dashboard(st.session_state.user_id)
+    display_refresh_button(fetch_manager_dashboard)
     
     if not result.get("success"):
         st.error(f"Error loading dashboard: {result.get('error', 'Unknown error')}")
         return
     
+    stats = result.get("statistics") or {}
+    
     # Display metrics
     st.subheader("📊 Key Metrics")
-    display_metrics(result.get("statistics", {}))
+    display_metrics(stats)
     
     # Display projects
     st.subheader("📁 All Projects")
@@ -195,7 +539,6 @@ def display_manager_dashboard():
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("💰 Revenue Summary")
-        stats = result.get("statistics", {})
         st.write(f"""
         - **Total Revenue**: ₹{stats.get('total_revenue', 0):,.0f}
         - **Active Projects**: {stats.get('active_projects', 0)}
@@ -204,18 +547,15 @@ def display_manager_dashboard():
     
     with col2:
         st.subheader("⚠️ Pending Items")
-        stats = result.get("statistics", {})
         st.write(f"""
         - **Pending Payments**: {stats.get('pending_payments_count', 0)}
         """)
 
 
-def display_executive_dashboard():
+def display_executive_dashboard(result: Dict[str, Any]):
     """Display the Executive Dashboard."""
     st.title("👤 Executive Dashboard")
-    
-    # Fetch data
-    result = get_executive_dashboard(st.session_state.user_id)
+    display_refresh_button(fetch_executive_dashboard)
     
     if not result.get("success"):
         st.error(f"Error loading dashboard: {result.get('error', 'Unknown error')}")
@@ -223,7 +563,7 @@ def display_executive_dashboard():
     
     # Display metrics
     st.subheader("📊 Your Projects")
-    display_metrics(result.get("statistics", {}))
+    display_metrics(result.get("statistics") or {})
     
     # Display projects
     st.subheader("📁 My Projects")
@@ -238,15 +578,33 @@ def display_nlp_chat():
     """Display the NLP chat interface."""
     st.title("💬 NLP Message Processor")
     
-    st.write("""
-    Send natural language messages to automate sales operations.
-    Examples:
-    - "Google ka iss week ka 1.2 lakh payment aa gaya"
-    - "Ramesh is assigned to Google project"
-    - "Google project active karo"
-    - "Dharmendra ke sare active project dikhado"
-    """)
+    st.write(NLP_EXAMPLES_TEXT)
+    
+    # A page run that finds a message in flight polls it with run_every;
+    # messages sent from the form poll with fragment-scoped reruns instead
+    job = st.session_state.get("nlp_job")
+    running = bool(job) and not job["done"].is_set()
+    chat_form = st.fragment(display_chat_form, run_every=NLP_POLL_INTERVAL if running else None)
+    chat_form(st.session_state.user_id, running)
     
+    # Display chat history
+    st.subheader("📝 Message History")
+    messages = st.session_state.chat_messages
+    if messages:
+        for msg in islice(messages, max(len(messages) - 5, 0), None):  # Show last 5 messages
+            with st.expander(f"📨 {msg['message'][:50]}..."):
+                st.write(msg)
+    else:
+        st.info("No messages yet. Send a message to get started!")
+
+
+def display_chat_form(user_id: int, auto_polled: bool):
+    """Display the chat input and the current message's progress or result.
+
+    Runs as a fragment so sending a message and polling its progress only
+    rerun this section. ``auto_polled`` tells whether the fragment was
+    declared with ``run_every`` because a message was already in flight.
+    """
     # Message input
     col1, col2 = st.columns([4, 1])
     with col1:
@@ -255,88 +613,121 @@ def display_nlp_chat():
             placeholder="e.g., Google ka iss week ka 1.2 lakh payment aa gaya",
             label_visibility="collapsed",
         )
+    job = st.session_state.get("nlp_job")
+    running = bool(job) and not job["done"].is_set()
     with col2:
-        send_button = st.button("Send", use_container_width=True)
+        send_button = st.button("Send", use_container_width=True, disabled=running)
+    
+    # Process message in the background
+    if send_button and message and not running:
+        job = st.session_state.nlp_job = start_nlp_job(message, user_id)
+        running = True
+    
+    if job:
+        display_nlp_job(job)
     
-    # Process message
-    if send_button and message:
-        with st.spinner("Processing message..."):
-            result = process_nlp_message(message, st.session_state.user_id)
+    if running and not auto_polled:
+        # Only reachable from a fragment run, where a fragment-scoped rerun is allowed
+        time.sleep(NLP_POLL_INTERVAL)
+        st.rerun(scope="fragment")
+    elif auto_polled and not running:
+        # One full rerun to redeclare the fragment without its run_every timer
+        st.rerun()
+
+
+def display_nlp_job(job: Dict[str, Any]):
+    """Display the phases an NLP job has produced so far."""
+    done = job["done"].is_set()
+    result = {}
+    with st.status("Parsing message...", expanded=True) as status:
+        for chunk in list(job["chunks"]):
+            result.update(chunk)
+            if not result.get("success"):
+                break
+            if "parsed" in chunk:
+                display_parsed_intent(chunk["parsed"])
+                status.update(label="Executing action...")
+            if "execution" in chunk:
+                display_execution_result(chunk["execution"])
         
-        # Display result
-        if result.get("success"):
-            st.success("✅ Message processed successfully!")
-            
-            # Show parsed intent
-            parsed = result.get("parsed", {})
-            st.subheader("🔍 Parsed Intent")
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.write(f"**Intent**: {parsed.get('intent', 'N/A')}")
-            with col2:
-                st.write(f"**Action**: {parsed.get('action', 'N/A')}")
-            with col3:
-                st.write(f"**Confidence**: {parsed.get('confidence', 0):.0%}")
-            
-            # Show extracted entities
-            st.subheader("📋 Extracted Entities")
-            entities = {k: v for k, v in parsed.items() 
-                       if k not in ['intent', 'action', 'confidence', 'original_message', 'timestamp']}
-            if entities:
-                for key, value in entities.items():
-                    st.write(f"- **{key.replace('_', ' ').title()}**: {value}")
-            
-            # Show execution result
-            execution = result.get("execution", {})
-            if execution.get("success"):
-                st.subheader("✨ Execution Result")
-                st.write(f"**Status**: {execution.get('action', 'N/A')}")
-                data = execution.get("data", {})
-                for key, value in data.items():
-                    st.write(f"- **{key.replace('_', ' ').title()}**: {value}")
-        else:
-            st.error(f"❌ Error: {result.get('error', 'Unknown error')}")
+        if done and result.get("success"):
+            status.update(label="✅ Message processed successfully!", state="complete")
+        elif done:
+            status.update(label="❌ Message processing failed", state="error")
     
-    # Display chat history
-    st.subheader("📝 Message History")
-    if st.session_state.chat_messages:
-        for msg in st.session_state.chat_messages[-5:]:  # Show last 5 messages
-            with st.expander(f"📨 {msg['message'][:50]}..."):
-                st.write(msg)
-    else:
-        st.info("No messages yet. Send a message to get started!")
+    if done and not result.get("success"):
+        st.error(f"❌ Error: {result.get('error', 'Unknown error')}")
+
+
+def display_parsed_intent(parsed: Dict[str, Any]):
+    """Display the parsed intent and extracted entities of a message."""
+    st.subheader("🔍 Parsed Intent")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.write(f"**Intent**: {parsed.get('intent', 'N/A')}")
+    with col2:
+        st.write(f"**Action**: {parsed.get('action', 'N/A')}")
+    with col3:
+        st.write(f"**Confidence**: {parsed.get('confidence', 0):.0%}")
+    
+    # Show extracted entities
+    st.subheader("📋 Extracted Entities")
+    entities = {k: v for k, v in parsed.items() if k not in PARSED_META_KEYS}
+    if entities:
+        for key, value in entities.items():
+            st.write(f"- **{key.replace('_', ' ').title()}**: {value}")
+
+
+def display_execution_result(execution: Dict[str, Any]):
+    """Display the result of executing a parsed message."""
+    if execution.get("success"):
+        st.subheader("✨ Execution Result")
+        st.write(f"**Status**: {execution.get('action', 'N/A')}")
+        data = execution.get("data", {})
+        for key, value in data.items():
+            st.write(f"- **{key.replace('_', ' ').title()}**: {value}")
 
 
 # ============================================================================
 # Sidebar Navigation
 # ============================================================================
 
-def display_sidebar():
+def select_user(users_by_id: Dict[int, Dict[str, Any]]):
+    """Apply a new user selection before the rerun starts.
+
+    This lets ``fetch_page_data`` prefetch the dashboard for the new user's
+    role alongside the other requests instead of after the sidebar renders.
+    """
+    selected_user = users_by_id.get(st.session_state.selected_user_id)
+    if selected_user:
+        st.session_state.user_id = selected_user["id"]
+        st.session_state.user_role = selected_user["role"]
+
+
+def display_sidebar(users_result: Dict[str, Any], health: Optional[Dict[str, Any]]):
     """Display sidebar with navigation and settings."""
     with st.sidebar:
         st.title("⚙️ Settings")
         
         # User selection
         st.subheader("👤 User Profile")
-        users_result = get_users()
         
         if users_result.get("success"):
-            users = users_result.get("users", [])
-            user_options = {u["id"]: f"{u['name']} ({u['role']})" for u in users}
+            users_by_id = users_result["users_by_id"]
+            user_options = users_result["user_options"]
             
-            selected_user_id = st.selectbox(
+            st.selectbox(
                 "Select User:",
                 options=list(user_options.keys()),
                 format_func=lambda x: user_options[x],
                 index=0,
+                key="selected_user_id",
+                on_change=select_user,
+                args=(users_by_id,),
             )
             
-            st.session_state.user_id = selected_user_id
-            
-            # Get user role
-            selected_user = next((u for u in users if u["id"] == selected_user_id), None)
-            if selected_user:
-                st.session_state.user_role = selected_user["role"]
+            # Also applies the default selection on the first run
+            select_user(users_by_id)
         else:
             st.error("Could not load users")
         
@@ -348,14 +739,16 @@ def display_sidebar():
             "Select Page:",
             options=["Dashboard", "NLP Chat", "About"],
             label_visibility="collapsed",
+            key="page",
         )
         
         st.divider()
         
         # Server status
         st.subheader("🔗 Server Status")
-        health = api_call("/health")
-        if health.get("success") or "status" in health:
+        if health is None:
+            st.info("⏳ Checking connection...")
+        elif health.get("success") or "status" in health:
             st.success(f"✅ Connected (v{health.get('version', 'unknown')})")
         else:
             st.error("❌ Cannot connect to API server")
@@ -383,58 +776,28 @@ def main():
     """Main application entry point."""
     initialize_session()
     
-    page = display_sidebar()
+    health = refresh_health()
+    prefetched_for = (st.session_state.user_id, st.session_state.user_role)
+    users_result, dashboard_result = fetch_page_data()
+    page = display_sidebar(users_result, health)
     
     if page == "Dashboard":
+        # The sidebar can still change the user on the first run
+        current_user = (st.session_state.user_id, st.session_state.user_role)
+        if dashboard_result is None or current_user != prefetched_for:
+            dashboard_result = get_dashboard(*current_user)
+        
         if st.session_state.user_role == "manager":
-            display_manager_dashboard()
+            display_manager_dashboard(dashboard_result)
         else:
-            display_executive_dashboard()
+            display_executive_dashboard(dashboard_result)
     
     elif page == "NLP Chat":
         display_nlp_chat()
     
     elif page == "About":
         st.title("📖 About FASTMCP")
-        st.markdown("""
-        ## FASTMCP – Sales Team Automation ERP
-        
-        FASTMCP is a comprehensive **MCP Server** built with **FastAPI**, **PostgreSQL**, 
-        and **SQLAlchemy ORM** for automating sales team workflows.
-        
-        ### Key Features
-        
-        - **Sales Project Management** – Track multiple projects per client
-        - **Team Management** – Assign employees to projects with duration tracking
-        - **Payment Tracking** – Record and track weekly/pending payments
-        - **NLP Automation** – Convert natural language messages into database actions
-        - **Role-Based Dashboards** – Separate views for Managers and Executives
-        
-        ### Technology Stack
-        
-        - **Backend**: FastAPI + fastmcp
-        - **Database**: PostgreSQL + SQLAlchemy ORM
-        - **Frontend**: Streamlit (this app) + React
-        - **Language**: Python 3.11+
-        
-        ### Example NLP Commands
-        
-        - "Google ka iss week ka 1.2 lakh payment aa gaya"
-        - "Ramesh is assigned to Google project"
-        - "Google project active karo"
-        - "Dharmendra ke sare active project dikhado"
-        
-        ### Getting Started
-        
-        1. Ensure the FastAPI server is running on `http://localhost:8000`
-        2. Select a user from the sidebar
-        3. Navigate to Dashboard or NLP Chat
-        4. Explore the features!
-        
-        ### Documentation
-        
-        For more information, see `FASTMCP_README.md` in the project root.
-        """)
+        st.markdown(ABOUT_MARKDOWN)
 
 
 if __name__ == "__main__":